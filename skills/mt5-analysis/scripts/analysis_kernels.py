@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Vectorized trade-analysis kernels for batch scoring.
+
+These operate on flat float64 arrays so that agents scoring many
+candidate trades at once avoid per-trade Python arithmetic and dict
+building. When numba is installed the kernels are JIT-compiled (with
+on-disk caching to amortize the first-call compile); otherwise they run
+as plain numpy vector operations.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _maybe_jit(fn):
+    if njit is None:
+        return fn
+    return njit(cache=True)(fn)
+
+
+@_maybe_jit
+def spread_pips(ask: np.ndarray, bid: np.ndarray, point: np.ndarray) -> np.ndarray:
+    """Spread in pips per candidate.
+
+    Args:
+        ask: Ask prices
+        bid: Bid prices
+        point: Per-symbol point sizes
+
+    Returns:
+        Spread in pips
+    """
+    return (ask - bid) / point
+
+
+@_maybe_jit
+def risk_percent(sl_profit: np.ndarray, balance: np.ndarray) -> np.ndarray:
+    """Stop-loss risk as a percentage of account balance.
+
+    Args:
+        sl_profit: Profit at the stop-loss price (negative for a loss)
+        balance: Account balances
+
+    Returns:
+        Risk percentage per candidate
+    """
+    return np.abs(sl_profit) / balance * 100.0
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def risk_reward(sl_profit: np.ndarray, tp_profit: np.ndarray) -> np.ndarray:
+        """Risk/reward ratio per candidate (NaN where the SL is not a loss).
+
+        Args:
+            sl_profit: Profit at the stop-loss price
+            tp_profit: Profit at the take-profit price
+
+        Returns:
+            Risk/reward ratios
+        """
+        out = np.empty(sl_profit.shape, dtype=np.float64)
+        for i in range(sl_profit.shape[0]):
+            if sl_profit[i] < 0.0 and tp_profit[i] != 0.0:
+                out[i] = abs(tp_profit[i] / sl_profit[i])
+            else:
+                out[i] = np.nan
+        return out
+
+else:
+
+    def risk_reward(sl_profit: np.ndarray, tp_profit: np.ndarray) -> np.ndarray:
+        """Risk/reward ratio per candidate (NaN where the SL is not a loss).
+
+        Args:
+            sl_profit: Profit at the stop-loss price
+            tp_profit: Profit at the take-profit price
+
+        Returns:
+            Risk/reward ratios
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(
+                (sl_profit < 0.0) & (tp_profit != 0.0),
+                np.abs(tp_profit / sl_profit),
+                np.nan,
+            )
+
+
+@_maybe_jit
+def sufficient_margin(margin: np.ndarray, margin_free: np.ndarray) -> np.ndarray:
+    """Whether each candidate's required margin fits the free margin.
+
+    Args:
+        margin: Required margins
+        margin_free: Free margins
+
+    Returns:
+        Boolean array
+    """
+    return margin <= margin_free
+
+
+def analyze_batch(
+    ask: np.ndarray,
+    bid: np.ndarray,
+    point: np.ndarray,
+    sl_profit: np.ndarray,
+    tp_profit: np.ndarray,
+    balance: np.ndarray,
+    margin: np.ndarray,
+    margin_free: np.ndarray,
+) -> dict:
+    """Score a batch of candidate trades in one vectorized pass.
+
+    All inputs are parallel float64 arrays of the same length.
+
+    Returns:
+        Struct-of-arrays dictionary with spread_pips, risk_percent,
+        risk_reward, and sufficient_margin arrays
+    """
+    return {
+        "spread_pips": spread_pips(ask, bid, point),
+        "risk_percent": risk_percent(sl_profit, balance),
+        "risk_reward": risk_reward(sl_profit, tp_profit),
+        "sufficient_margin": sufficient_margin(margin, margin_free),
+    }
@@ -1,17 +1,79 @@
 #!/usr/bin/env python3
 """Analyze trade parameters including margin, profit, and risk."""
 
+from __future__ import annotations
+
 import argparse
-import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-import MetaTrader5 as mt5
-from pdmt5 import Mt5Config, Mt5TradingClient
+import orjson
 
+if TYPE_CHECKING:
+    from pdmt5 import Mt5TradingClient
 
-def analyze_trade(
-    login: int,
-    password: str,
-    server: str,
+_CONNECTION_SCRIPTS = str(
+    Path(__file__).resolve().parents[2] / "mt5-connection" / "scripts"
+)
+if _CONNECTION_SCRIPTS not in sys.path:
+    sys.path.insert(0, _CONNECTION_SCRIPTS)
+
+from mt5_client_manager import get_symbol_point
+from mt5_daemon import execute_skill
+
+_mt5 = None
+
+
+def _get_mt5():
+    """Return the MetaTrader5 module, imported once on first use."""
+    global _mt5
+    if _mt5 is None:
+        import MetaTrader5
+
+        _mt5 = MetaTrader5
+    return _mt5
+
+
+def quick_risk_reward(
+    symbol: str,
+    volume: float,
+    side: str,
+    entry_price: float,
+    stop_loss: float,
+    take_profit: float,
+) -> dict:
+    """Compute a price-based risk/reward ratio without touching MT5.
+
+    Args:
+        symbol: Trading symbol
+        volume: Lot size
+        side: Order side (BUY or SELL)
+        entry_price: Entry price
+        stop_loss: Stop loss price
+        take_profit: Take profit price
+
+    Returns:
+        Reduced analysis dictionary with the risk/reward ratio
+    """
+    sign = 1.0 if side == "BUY" else -1.0
+    risk = sign * (entry_price - stop_loss)
+    reward = sign * (take_profit - entry_price)
+
+    return {
+        "symbol": symbol,
+        "side": side,
+        "volume": volume,
+        "entry_price": entry_price,
+        "stop_loss": {"price": stop_loss},
+        "take_profit": {"price": take_profit},
+        "risk_reward_ratio": abs(reward / risk) if risk > 0 else None,
+    }
+
+
+def analyze_trade_with_client(
+    client: Mt5TradingClient,
     symbol: str,
     volume: float,
     side: str,
@@ -20,12 +82,10 @@ def analyze_trade(
     stop_loss: float | None = None,
     take_profit: float | None = None,
 ) -> dict:
-    """Analyze a potential trade.
+    """Analyze a potential trade using an already-connected client.
 
     Args:
-        login: MT5 account number
-        password: Account password
-        server: Broker server name
+        client: Connected Mt5TradingClient instance
         symbol: Trading symbol
         volume: Lot size
         side: Order side (BUY or SELL)
@@ -37,127 +97,190 @@ def analyze_trade(
     Returns:
         Analysis results dictionary
     """
-    config = Mt5Config(login=login, password=password, server=server)
-    client = Mt5TradingClient(config=config)
+    # Still deferred relative to --help, but bound at module level so
+    # repeated calls skip the import-statement machinery.
+    mt5 = _get_mt5()
 
-    try:
-        client.initialize_and_login_mt5()
+    # Fetch account, symbol, and tick info concurrently; each is an
+    # independent round-trip to the MT5 terminal. The point size is a
+    # session constant, so it is served from the manager's cache after
+    # the first call for a symbol.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        f_account = executor.submit(client.account_info_as_dict)
+        f_point = executor.submit(get_symbol_point, symbol)
+        f_tick = executor.submit(client.symbol_info_tick, symbol)
+        account = f_account.result()
+        point = f_point.result()
+        tick = f_tick.result()
 
-        # Get account info
-        account = client.account_info_as_dict()
+    if point is None or tick is None:
+        return {"error": f"Symbol {symbol} not found"}
 
-        # Get symbol info
-        symbol_info = client.symbol_info(symbol)
-        tick = client.symbol_info_tick(symbol)
+    action = mt5.ORDER_TYPE_BUY if side == "BUY" else mt5.ORDER_TYPE_SELL
 
-        if symbol_info is None or tick is None:
-            return {"error": f"Symbol {symbol} not found"}
+    # Use current price if not specified
+    if entry_price is None:
+        entry_price = tick.ask if side == "BUY" else tick.bid
 
-        side_upper = side.upper()
-        action = mt5.ORDER_TYPE_BUY if side_upper == "BUY" else mt5.ORDER_TYPE_SELL
+    # Calculate margin
+    margin = client.calculate_minimum_order_margin(
+        symbol=symbol,
+        volume=volume,
+        order_side=side,
+    )
 
-        # Use current price if not specified
-        if entry_price is None:
-            entry_price = tick.ask if side_upper == "BUY" else tick.bid
+    # Calculate spread
+    spread_points = tick.ask - tick.bid
+    spread_pips = spread_points / point
 
-        # Calculate margin
-        margin = client.calculate_minimum_order_margin(
-            symbol=symbol,
-            volume=volume,
-            order_side=side_upper,
+    # Calculate exit/SL/TP profits concurrently; the MT5 binding releases
+    # the GIL during IPC, so the independent round-trips overlap.
+    targets = {
+        key: price
+        for key, price in (
+            ("exit", exit_price),
+            ("stop_loss", stop_loss),
+            ("take_profit", take_profit),
         )
-
-        # Calculate spread
-        spread_points = tick.ask - tick.bid
-        spread_pips = spread_points / symbol_info.point
-
-        # Calculate profit if exit price given
-        profit = None
-        if exit_price:
-            profit = client.order_calc_profit(
-                action=action,
-                symbol=symbol,
-                volume=volume,
-                price_open=entry_price,
-                price_close=exit_price,
-            )
-
-        # Calculate SL/TP profit
-        sl_profit = None
-        tp_profit = None
-
-        if stop_loss:
-            sl_profit = client.order_calc_profit(
-                action=action,
-                symbol=symbol,
-                volume=volume,
-                price_open=entry_price,
-                price_close=stop_loss,
-            )
-
-        if take_profit:
-            tp_profit = client.order_calc_profit(
-                action=action,
-                symbol=symbol,
-                volume=volume,
-                price_open=entry_price,
-                price_close=take_profit,
-            )
-
-        # Calculate risk/reward ratio
-        risk_reward = None
-        if sl_profit and tp_profit and sl_profit < 0:
-            risk_reward = abs(tp_profit / sl_profit)
-
-        return {
-            "symbol": symbol,
-            "side": side_upper,
-            "volume": volume,
-            "entry_price": entry_price,
-            "account": {
-                "balance": account["balance"],
-                "equity": account["equity"],
-                "margin_free": account["margin_free"],
-                "currency": account["currency"],
-            },
-            "margin": {
-                "required": margin,
-                "available": account["margin_free"],
-                "sufficient": margin <= account["margin_free"] if margin else None,
-            },
-            "spread": {
-                "points": spread_points,
-                "pips": spread_pips,
-            },
-            "profit_calc": {
-                "exit_price": exit_price,
-                "profit": profit,
-            }
-            if exit_price
-            else None,
-            "stop_loss": {
-                "price": stop_loss,
-                "profit": sl_profit,
-                "risk_percent": (abs(sl_profit) / account["balance"] * 100)
-                if sl_profit
-                else None,
-            }
-            if stop_loss
-            else None,
-            "take_profit": {
-                "price": take_profit,
-                "profit": tp_profit,
+        if price
+    }
+    profits = {}
+    if targets:
+        with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+            futures = {
+                key: executor.submit(
+                    client.order_calc_profit,
+                    action=action,
+                    symbol=symbol,
+                    volume=volume,
+                    price_open=entry_price,
+                    price_close=price,
+                )
+                for key, price in targets.items()
             }
-            if take_profit
+            profits = {key: f.result() for key, f in futures.items()}
+
+    profit = profits.get("exit")
+    sl_profit = profits.get("stop_loss")
+    tp_profit = profits.get("take_profit")
+
+    # Calculate risk/reward ratio
+    risk_reward = None
+    if sl_profit and tp_profit and sl_profit < 0:
+        risk_reward = abs(tp_profit / sl_profit)
+
+    return {
+        "symbol": symbol,
+        "side": side,
+        "volume": volume,
+        "entry_price": entry_price,
+        "account": {
+            "balance": account["balance"],
+            "equity": account["equity"],
+            "margin_free": account["margin_free"],
+            "currency": account["currency"],
+        },
+        "margin": {
+            "required": margin,
+            "available": account["margin_free"],
+            "sufficient": margin <= account["margin_free"] if margin else None,
+        },
+        "spread": {
+            "points": spread_points,
+            "pips": spread_pips,
+        },
+        "profit_calc": {
+            "exit_price": exit_price,
+            "profit": profit,
+        }
+        if exit_price
+        else None,
+        "stop_loss": {
+            "price": stop_loss,
+            "profit": sl_profit,
+            "risk_percent": (abs(sl_profit) / account["balance"] * 100)
+            if sl_profit
             else None,
-            "risk_reward_ratio": risk_reward,
         }
+        if stop_loss
+        else None,
+        "take_profit": {
+            "price": take_profit,
+            "profit": tp_profit,
+        }
+        if take_profit
+        else None,
+        "risk_reward_ratio": risk_reward,
+    }
 
-    finally:
-        try:
-            client.shutdown()
-        except Exception:
-            pass
+
+def analyze_trade(
+    login: int,
+    password: str,
+    server: str,
+    symbol: str,
+    volume: float,
+    side: str,
+    entry_price: float | None = None,
+    exit_price: float | None = None,
+    stop_loss: float | None = None,
+    take_profit: float | None = None,
+    quick: bool = False,
+) -> dict:
+    """Analyze a potential trade.
+
+    Uses the shared daemon session when MT5_AGENT_DAEMON points at a
+    running daemon; otherwise connects in-process. In quick mode the
+    risk/reward ratio is computed purely from the supplied prices, with
+    no MT5 connection at all.
+
+    Args:
+        login: MT5 account number
+        password: Account password
+        server: Broker server name
+        symbol: Trading symbol
+        volume: Lot size
+        side: Order side (BUY or SELL)
+        entry_price: Entry price (uses current price if None)
+        exit_price: Exit price for profit calculation
+        stop_loss: Stop loss price
+        take_profit: Take profit price
+        quick: Skip all MT5 round-trips and return only price-based
+            results (requires entry_price, stop_loss, and take_profit)
+
+    Returns:
+        Analysis results dictionary
+    """
+    # Normalized once here; everything downstream trusts uppercase.
+    side = side.upper()
+    if quick:
+        if not (entry_price and stop_loss and take_profit):
+            return {
+                "error": "quick mode requires entry, stop loss, and take profit prices"
+            }
+        return quick_risk_reward(
+            symbol=symbol,
+            volume=volume,
+            side=side,
+            entry_price=entry_price,
+            stop_loss=stop_loss,
+            take_profit=take_profit,
+        )
+
+    return execute_skill(
+        "analyze_trade",
+        analyze_trade_with_client,
+        login,
+        password,
+        server,
+        symbol=symbol,
+        volume=volume,
+        side=side,
+        entry_price=entry_price,
+        exit_price=exit_price,
+        stop_loss=stop_loss,
+        take_profit=take_profit,
+    )
 
 
 def main():
@@ -168,12 +291,18 @@ def main():
     parser.add_argument("--symbol", required=True, help="Trading symbol")
     parser.add_argument("--volume", type=float, required=True, help="Lot size")
     parser.add_argument(
-        "--side", required=True, choices=["BUY", "SELL", "buy", "sell"], help="Order side"
+        "--side", required=True, type=str.upper, choices=["BUY", "SELL"], help="Order side"
     )
     parser.add_argument("--entry", type=float, help="Entry price (uses current if omitted)")
     parser.add_argument("--exit", type=float, help="Exit price for profit calculation")
     parser.add_argument("--sl", type=float, help="Stop loss price")
     parser.add_argument("--tp", type=float, help="Take profit price")
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="Price-based risk/reward only, without connecting to MT5 "
+        "(requires --entry, --sl, and --tp)",
+    )
 
     args = parser.parse_args()
 
@@ -188,9 +317,13 @@ def main():
         exit_price=args.exit,
         stop_loss=args.sl,
         take_profit=args.tp,
+        quick=args.quick,
     )
 
-    print(json.dumps(result, indent=2))
+    sys.stdout.buffer.write(
+        orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        + b"\n"
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""Process-wide MT5 client manager shared by the skill scripts."""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, Generator
+
+if TYPE_CHECKING:
+    from pdmt5 import Mt5Config, Mt5TradingClient
+
+
+class Mt5ClientManager:
+    """Owner of a single Mt5TradingClient instance.
+
+    The manager keeps one client per process so repeated skill calls can
+    share an MT5 session instead of paying the login handshake on every
+    invocation. Use get_client_manager() to obtain the shared instance.
+    """
+
+    def __init__(self):
+        self._client: Mt5TradingClient | None = None
+        self._config: Mt5Config | None = None
+        self._connected = False
+        self._refcount = 0
+        self._current_login: tuple[int, str] | None = None
+
+    def configure(
+        self,
+        login: int,
+        password: str,
+        server: str,
+        timeout: int = 60000,
+        path: str | None = None,
+    ) -> None:
+        """Build the client config and client instance.
+
+        Args:
+            login: MT5 account number
+            password: Account password
+            server: Broker server name
+            timeout: Connection timeout in milliseconds
+            path: Optional path to MT5 terminal executable
+        """
+        # Imported here so that loading this module (and the CLI scripts
+        # that import it) stays cheap until a connection is needed.
+        from pdmt5 import Mt5TradingClient
+
+        self._config = _make_config(login, password, server, timeout, path)
+        self._client = Mt5TradingClient(config=self._config)
+        self._current_login = (login, server)
+
+    def connect(self) -> None:
+        """Initialize and log in to the MT5 terminal."""
+        if self._client is None:
+            raise RuntimeError("Manager is not configured; call configure() first")
+        self._client.initialize_and_login_mt5()
+        self._connected = True
+
+    def disconnect(self) -> None:
+        """Shut down the MT5 terminal connection."""
+        self._connected = False
+        _symbol_info_for.cache_clear()
+        if self._client is not None:
+            try:
+                self._client.shutdown()
+            except Exception:
+                pass
+
+    def get_client(self) -> Mt5TradingClient:
+        """Return the managed client.
+
+        Returns:
+            Connected Mt5TradingClient instance
+        """
+        if self._client is None:
+            raise RuntimeError("Manager is not configured; call configure() first")
+        return self._client
+
+    @property
+    def is_connected(self) -> bool:
+        return self._connected
+
+
+@lru_cache(maxsize=16)
+def _make_config(
+    login: int, password: str, server: str, timeout: int, path: str | None
+) -> Mt5Config:
+    """Build an Mt5Config, memoized on the credential tuple.
+
+    Mt5Config is a validated model; repeated configure() calls with the
+    same credentials (the agent-loop and daemon reconfigure pattern)
+    reuse the instance instead of re-running validation.
+    """
+    from pdmt5 import Mt5Config
+
+    return Mt5Config(
+        login=login,
+        password=password,
+        server=server,
+        timeout=timeout,
+        path=path,
+    )
+
+
+_client_manager: Mt5ClientManager | None = None
+_client_manager_lock = threading.Lock()
+
+
+def get_client_manager() -> Mt5ClientManager:
+    """Return the process-wide Mt5ClientManager singleton."""
+    global _client_manager
+    if _client_manager is None:
+        with _client_manager_lock:
+            if _client_manager is None:
+                _client_manager = Mt5ClientManager()
+    return _client_manager
+
+
+def run_with_client(fn, login: int, password: str, server: str, **kwargs):
+    """Run fn(client, **kwargs) inside a managed MT5 connection.
+
+    Args:
+        fn: Callable taking a connected client as first argument
+        login: MT5 account number
+        password: Account password
+        server: Broker server name
+        **kwargs: Forwarded to fn
+
+    Returns:
+        Whatever fn returns
+    """
+    with mt5_connection(login, password, server) as client:
+        return fn(client, **kwargs)
+
+
+class _SymbolNotFoundError(Exception):
+    """Raised inside _symbol_info_for so failed lookups are not cached."""
+
+
+@lru_cache(maxsize=256)
+def _symbol_info_for(client_id: int, symbol: str):
+    """Fetch symbol_info through the managed client, keyed by client identity.
+
+    Cached because contract specs like point and digits are constant for
+    the life of a terminal session; the cache is cleared on disconnect.
+    A failed lookup raises instead of returning None, which lru_cache
+    does not record, so a symbol that appears in Market Watch
+    mid-session is picked up on the next call.
+    """
+    info = get_client_manager().get_client().symbol_info(symbol)
+    if info is None:
+        raise _SymbolNotFoundError(symbol)
+    return info
+
+
+def get_symbol_point(symbol: str) -> float | None:
+    """Return the per-symbol point size, cached until disconnect.
+
+    Args:
+        symbol: Trading symbol (e.g., EURUSD)
+
+    Returns:
+        Point size, or None when the symbol is unknown
+    """
+    try:
+        info = _symbol_info_for(id(get_client_manager().get_client()), symbol)
+    except _SymbolNotFoundError:
+        return None
+    return info.point
+
+
+def get_symbol_digits(symbol: str) -> int | None:
+    """Return the per-symbol price digits, cached until disconnect.
+
+    Args:
+        symbol: Trading symbol (e.g., EURUSD)
+
+    Returns:
+        Number of price digits, or None when the symbol is unknown
+    """
+    try:
+        info = _symbol_info_for(id(get_client_manager().get_client()), symbol)
+    except _SymbolNotFoundError:
+        return None
+    return info.digits
+
+
+@contextmanager
+def mt5_connection(
+    login: int,
+    password: str,
+    server: str,
+    timeout: int = 60000,
+    path: str | None = None,
+) -> Generator[Mt5TradingClient, None, None]:
+    """Context manager yielding a connected client from the shared manager.
+
+    Args:
+        login: MT5 account number
+        password: Account password
+        server: Broker server name
+        timeout: Connection timeout in milliseconds
+        path: Optional path to MT5 terminal executable
+
+    Yields:
+        Connected Mt5TradingClient instance
+
+    The connection is reference-counted: nested or rapid successive
+    blocks with the same login reuse the live session, and only the
+    outermost exit disconnects.
+    """
+    manager = get_client_manager()
+    if manager.is_connected and manager._current_login == (login, server):
+        manager._refcount += 1
+    else:
+        if manager.is_connected:
+            manager.disconnect()
+        manager.configure(
+            login=login,
+            password=password,
+            server=server,
+            timeout=timeout,
+            path=path,
+        )
+        manager.connect()
+        manager._refcount = 1
+    try:
+        yield manager.get_client()
+    finally:
+        manager._refcount -= 1
+        if manager._refcount <= 0:
+            manager.disconnect()
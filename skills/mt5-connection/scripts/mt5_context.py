@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 """MT5 connection context manager for automatic session management."""
 
+from __future__ import annotations
+
 from contextlib import contextmanager
-from typing import Generator
+from typing import TYPE_CHECKING, Generator
 
-from pdmt5 import Mt5Config, Mt5TradingClient
+if TYPE_CHECKING:
+    from pdmt5 import Mt5TradingClient
 
 
 @contextmanager
@@ -32,6 +35,10 @@ def mt5_session(
             account = client.account_info_as_dict()
             print(f"Balance: {account['balance']}")
     """
+    # Deferred so that importing this module stays cheap until a
+    # connection is needed.
+    from pdmt5 import Mt5Config, Mt5TradingClient
+
     config = Mt5Config(
         login=login,
         password=password,
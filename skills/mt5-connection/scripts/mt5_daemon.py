@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""Long-lived MT5 daemon serving skill requests over a local socket.
+
+The daemon logs in to MT5 once and keeps the session open, so CLI scripts
+can skip the per-invocation login handshake and become thin RPC clients.
+Scripts opt in by setting the MT5_AGENT_DAEMON environment variable to the
+daemon address; when it is unset or unreachable they fall back to their
+normal in-process connection.
+
+Because the daemon holds a logged-in trading session, every request must
+carry the per-daemon token generated at startup; clients read it from
+MT5_AGENT_DAEMON_TOKEN or from the 0600 token file written next to the
+socket, so other local users cannot drive the session.
+"""
+
+import json
+import os
+import secrets
+import socket
+import socketserver
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable
+
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+from mt5_client_manager import get_client_manager, run_with_client
+
+DAEMON_ENV_VAR = "MT5_AGENT_DAEMON"
+TOKEN_ENV_VAR = "MT5_AGENT_DAEMON_TOKEN"
+
+
+def default_address() -> str:
+    """Return the default daemon address for this platform."""
+    if hasattr(socket, "AF_UNIX"):
+        return str(Path(tempfile.gettempdir()) / "mt5-agent-daemon.sock")
+    return "127.0.0.1:47117"
+
+
+def _parse_address(address: str) -> tuple[int, Any]:
+    """Split an address string into a socket family and sockaddr."""
+    if ":" in address and os.sep not in address:
+        host, _, port = address.rpartition(":")
+        return socket.AF_INET, (host, int(port))
+    return socket.AF_UNIX, address
+
+
+def _token_file_for(address: str) -> Path:
+    """Return the auth-token file path for a daemon address."""
+    if ":" in address and os.sep not in address:
+        return Path(tempfile.gettempdir()) / "mt5-agent-daemon.token"
+    return Path(address + ".token")
+
+
+def _load_token(address: str) -> str | None:
+    """Return the daemon auth token from the environment or token file."""
+    token = os.environ.get(TOKEN_ENV_VAR)
+    if token:
+        return token
+    try:
+        return _token_file_for(address).read_text().strip()
+    except OSError:
+        return None
+
+
+def _write_token_file(token_file: Path, token: str) -> None:
+    """Write the auth token readable only by the daemon's user."""
+    fd = os.open(token_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as stream:
+        stream.write(token + "\n")
+
+
+def _open_connection(address: str, timeout: float) -> socket.socket:
+    family, sockaddr = _parse_address(address)
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(sockaddr)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def find_daemon_address(timeout: float = 0.5) -> str | None:
+    """Return the daemon address if one is configured and reachable.
+
+    Returns:
+        Address string from MT5_AGENT_DAEMON, or None when the daemon is
+        not configured or not accepting connections.
+    """
+    address = os.environ.get(DAEMON_ENV_VAR)
+    if not address:
+        return None
+    try:
+        _open_connection(address, timeout=timeout).close()
+    except OSError:
+        return None
+    return address
+
+
+def daemon_request(
+    address: str,
+    op: str,
+    args: dict | None = None,
+    timeout: float = 60.0,
+) -> Any:
+    """Send one request to the daemon and return its result.
+
+    Args:
+        address: Daemon address (Unix socket path or host:port)
+        op: Operation name (e.g., fetch_rates)
+        args: Keyword arguments for the operation
+        timeout: Socket timeout in seconds
+
+    Returns:
+        The operation result decoded from JSON
+
+    Raises:
+        RuntimeError: If the daemon reports an error
+    """
+    payload = json.dumps(
+        {"op": op, "args": args or {}, "token": _load_token(address)}
+    ).encode() + b"\n"
+    sock = _open_connection(address, timeout=timeout)
+    with sock, sock.makefile("rb") as stream:
+        sock.sendall(payload)
+        line = stream.readline()
+    response = json.loads(line)
+    if not response.get("ok"):
+        raise RuntimeError(response.get("error", "daemon request failed"))
+    return response.get("result")
+
+
+def execute_skill(
+    op: str,
+    fn: Callable,
+    login: int,
+    password: str,
+    server: str,
+    local_kwargs: dict | None = None,
+    **kwargs: Any,
+) -> Any:
+    """Run a skill operation via the daemon when available, else in-process.
+
+    This is the single connection-lifecycle entry point shared by the CLI
+    scripts: it routes to the daemon session when MT5_AGENT_DAEMON is set
+    and reachable, and otherwise runs fn(client, **kwargs) inside a
+    managed connection.
+
+    Args:
+        op: Daemon operation name
+        fn: Client-first callable used for the in-process fallback
+        login: MT5 account number (fallback connection)
+        password: Account password (fallback connection)
+        server: Broker server name (fallback connection)
+        local_kwargs: Extra kwargs only meaningful in-process, such as
+            output sinks that cannot cross the daemon socket
+        **kwargs: JSON-serializable operation arguments
+
+    Returns:
+        The operation result
+    """
+    address = find_daemon_address()
+    if address is not None:
+        return daemon_request(address, op, kwargs)
+    return run_with_client(fn, login, password, server, **kwargs, **(local_kwargs or {}))
+
+
+def _load_operations() -> dict[str, Callable]:
+    """Import the skill scripts and map operation names to handlers."""
+    skills_dir = Path(__file__).resolve().parents[2]
+    for skill in ("mt5-market-data", "mt5-trading", "mt5-analysis"):
+        scripts_dir = str(skills_dir / skill / "scripts")
+        if scripts_dir not in sys.path:
+            sys.path.insert(0, scripts_dir)
+
+    from analyze_trade import analyze_trade_with_client
+    from close_positions import close_positions_with_client
+    from fetch_rates import fetch_rates_batch_with_client, fetch_rates_with_client
+    from place_order import place_order_with_client
+
+    return {
+        "account_info": lambda client: client.account_info_as_dict(),
+        "analyze_trade": analyze_trade_with_client,
+        "close_positions": close_positions_with_client,
+        "fetch_rates": fetch_rates_with_client,
+        "fetch_rates_batch": fetch_rates_batch_with_client,
+        "place_order": place_order_with_client,
+    }
+
+
+class _SkillRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+            if not secrets.compare_digest(
+                request.get("token") or "", self.server.auth_token
+            ):
+                response = {"ok": False, "error": "invalid or missing auth token"}
+            else:
+                operation = self.server.operations[request["op"]]
+                client = get_client_manager().get_client()
+                result = operation(client, **request.get("args", {}))
+                response = {"ok": True, "result": result}
+        except Exception as e:
+            response = {"ok": False, "error": str(e)}
+        self.wfile.write(json.dumps(response, default=str).encode() + b"\n")
+
+
+def serve(
+    login: int,
+    password: str,
+    server: str,
+    address: str | None = None,
+    timeout: int = 60000,
+    path: str | None = None,
+) -> None:
+    """Connect to MT5 once and serve skill requests until interrupted.
+
+    Args:
+        login: MT5 account number
+        password: Account password
+        server: Broker server name
+        address: Listen address (Unix socket path or host:port)
+        timeout: Connection timeout in milliseconds
+        path: Optional path to MT5 terminal executable
+    """
+    manager = get_client_manager()
+    manager.configure(
+        login=login,
+        password=password,
+        server=server,
+        timeout=timeout,
+        path=path,
+    )
+    manager.connect()
+
+    address = address or default_address()
+    family, sockaddr = _parse_address(address)
+
+    if family == socket.AF_INET:
+        server_cls = socketserver.ThreadingTCPServer
+    else:
+        server_cls = socketserver.ThreadingUnixStreamServer
+        Path(address).unlink(missing_ok=True)
+    server_cls.allow_reuse_address = True
+
+    auth_token = secrets.token_hex(16)
+    token_file = _token_file_for(address)
+
+    try:
+        with server_cls(sockaddr, _SkillRequestHandler) as srv:
+            if family != socket.AF_INET:
+                # Restrict to the daemon's user instead of trusting the
+                # umask; this session can place real orders.
+                os.chmod(address, 0o600)
+            _write_token_file(token_file, auth_token)
+            srv.operations = _load_operations()
+            srv.auth_token = auth_token
+            print(f"MT5 daemon listening on {address}")
+            print(f"Set {DAEMON_ENV_VAR}={address} to route skill scripts here")
+            print(f"Auth token written to {token_file} (or set {TOKEN_ENV_VAR})")
+            srv.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        manager.disconnect()
+        token_file.unlink(missing_ok=True)
+        if family != socket.AF_INET:
+            Path(address).unlink(missing_ok=True)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the MT5 skill daemon")
+    parser.add_argument("--login", type=int, required=True, help="MT5 account number")
+    parser.add_argument("--password", required=True, help="Account password")
+    parser.add_argument("--server", required=True, help="Broker server name")
+    parser.add_argument(
+        "--address",
+        help="Listen address: Unix socket path or host:port (default: platform-specific)",
+    )
+
+    args = parser.parse_args()
+
+    serve(
+        login=args.login,
+        password=args.password,
+        server=args.server,
+        address=args.address,
+    )
+
+
+if __name__ == "__main__":
+    main()
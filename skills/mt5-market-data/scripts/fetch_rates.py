@@ -1,64 +1,281 @@
 #!/usr/bin/env python3
 """Fetch OHLCV rates from MT5 and output as CSV or JSON."""
 
+from __future__ import annotations
+
 import argparse
-import json
 import sys
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, TextIO
 
-from pdmt5 import Mt5Config, Mt5TradingClient
+import orjson
 
+if TYPE_CHECKING:
+    from pdmt5 import Mt5TradingClient
 
-def fetch_rates(
+_CONNECTION_SCRIPTS = str(
+    Path(__file__).resolve().parents[2] / "mt5-connection" / "scripts"
+)
+if _CONNECTION_SCRIPTS not in sys.path:
+    sys.path.insert(0, _CONNECTION_SCRIPTS)
+
+from mt5_daemon import execute_skill
+
+_TIMEFRAMES = ("M1", "M5", "M15", "M30", "H1", "H4", "D1", "W1", "MN1")
+
+_mt5 = None
+
+
+def _get_mt5():
+    """Return the MetaTrader5 module, imported once on first use."""
+    global _mt5
+    if _mt5 is None:
+        import MetaTrader5
+
+        _mt5 = MetaTrader5
+    return _mt5
+
+
+def _check_timeframe(timeframe: str) -> None:
+    """Reject unknown timeframes before any login or daemon round-trip."""
+    if timeframe not in _TIMEFRAMES:
+        raise ValueError(
+            f"Invalid timeframe {timeframe!r}; expected one of {', '.join(_TIMEFRAMES)}"
+        )
+
+
+def fetch_rates_with_client(
+    client: Mt5TradingClient,
+    symbol: str,
+    timeframe: str = "H1",
+    count: int = 100,
+    output_format: str = "csv",
+    output: TextIO | None = None,
+) -> str | None:
+    """Fetch OHLCV rates using an already-connected client.
+
+    Args:
+        client: Connected Mt5TradingClient instance
+        symbol: Trading symbol (e.g., EURUSD)
+        timeframe: Timeframe (M1, M5, M15, M30, H1, H4, D1, W1, MN1)
+        count: Number of bars to fetch
+        output_format: Output format (csv, json, or arrow)
+        output: Optional text sink; when given, data is streamed into it
+            and None is returned instead of a string
+
+    Returns:
+        Formatted rates data (time column is epoch seconds), or None
+        when streamed into output. The arrow format (requires pyarrow)
+        serializes one contiguous Arrow IPC stream instead of formatting
+        every row, emitted as base64 text whether returned or written to
+        the sink — so CLI output is byte-identical with and without the
+        daemon; base64-decode, then read with pyarrow.ipc.open_stream.
+    """
+    # Still deferred relative to --help, but bound at module level so
+    # repeated calls skip the import-statement machinery.
+    mt5 = _get_mt5()
+
+    # Go straight to the structured ndarray returned by the terminal; the
+    # DataFrame round-trip copies every column and boxes dtypes just to
+    # serialize them again.
+    rates = mt5.copy_rates_from_pos(
+        symbol, getattr(mt5, "TIMEFRAME_" + timeframe), 0, count
+    )
+
+    if rates is None or len(rates) == 0:
+        message = f"No data found for {symbol}"
+        if output is None:
+            return message
+        output.write(message + "\n")
+        return None
+
+    names = list(rates.dtype.names)
+
+    if output_format == "json":
+        import numpy as np
+
+        # Field views of a structured array are strided, and orjson's
+        # numpy path only accepts C-contiguous input, so compact each
+        # column before serializing.
+        payload = orjson.dumps(
+            {name: np.ascontiguousarray(rates[name]) for name in names},
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+        ).decode()
+        if output is None:
+            return payload
+        output.write(payload + "\n")
+        return None
+    elif output_format == "arrow":
+        import base64
+
+        import pyarrow as pa
+
+        table = pa.Table.from_arrays(
+            [pa.array(rates[name]) for name in names], names=names
+        )
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        encoded = base64.b64encode(sink.getvalue().to_pybytes()).decode()
+        if output is None:
+            return encoded
+        output.write(encoded + "\n")
+        return None
+    else:
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+        except ImportError:
+            pa = None
+        if pa is not None:
+            table = pa.Table.from_arrays(
+                [pa.array(rates[name]) for name in names], names=names
+            )
+            if output is None:
+                buf = pa.BufferOutputStream()
+                pacsv.write_csv(table, buf)
+                return buf.getvalue().to_pybytes().decode()
+            # Stream straight to the sink's byte buffer; rows hit the OS
+            # as they are formatted instead of after the full CSV exists.
+            pacsv.write_csv(table, pa.output_stream(getattr(output, "buffer", output)))
+            return None
+        import pandas as pd
+
+        rates_df = pd.DataFrame(rates)
+        if output is None:
+            return rates_df.to_csv(index=False)
+        rates_df.to_csv(output, index=False)
+        return None
+
+
+def fetch_rates_batch_with_client(
+    client: Mt5TradingClient,
+    symbols: list[str],
+    timeframe: str = "H1",
+    count: int = 100,
+) -> str:
+    """Fetch OHLCV rates for several symbols over one connection.
+
+    Issues the per-symbol fetches concurrently; the MT5 binding releases
+    the GIL during IPC, so the round-trips overlap instead of paying the
+    full latency N times.
+
+    Args:
+        client: Connected Mt5TradingClient instance
+        symbols: Trading symbols (e.g., ["EURUSD", "USDJPY"])
+        timeframe: Timeframe (M1, M5, M15, M30, H1, H4, D1, W1, MN1)
+        count: Number of bars to fetch per symbol
+
+    Returns:
+        JSON object mapping each symbol to its column arrays (time column
+        is epoch seconds), or to null when the symbol returned no data
+    """
+    import numpy as np
+
+    mt5 = _get_mt5()
+    mt5_timeframe = getattr(mt5, "TIMEFRAME_" + timeframe)
+
+    def fetch_one(symbol: str):
+        return mt5.copy_rates_from_pos(symbol, mt5_timeframe, 0, count)
+
+    with ThreadPoolExecutor(max_workers=min(8, len(symbols))) as executor:
+        per_symbol = list(executor.map(fetch_one, symbols))
+
+    # As in fetch_rates_with_client, compact the strided field views so
+    # orjson's numpy path accepts them.
+    payload = {
+        symbol: {
+            name: np.ascontiguousarray(rates[name]) for name in rates.dtype.names
+        }
+        if rates is not None and len(rates) > 0
+        else None
+        for symbol, rates in zip(symbols, per_symbol)
+    }
+    return orjson.dumps(
+        payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+    ).decode()
+
+
+def fetch_rates_batch(
     login: int,
     password: str,
     server: str,
-    symbol: str,
+    symbols: list[str],
     timeframe: str = "H1",
     count: int = 100,
-    output_format: str = "csv",
 ) -> str:
-    """Fetch OHLCV rates from MT5.
+    """Fetch OHLCV rates for several symbols from MT5.
+
+    Uses the shared daemon session when MT5_AGENT_DAEMON points at a
+    running daemon; otherwise connects in-process. Either way the
+    symbols share a single login instead of one per invocation.
 
     Args:
         login: MT5 account number
         password: Account password
         server: Broker server name
-        symbol: Trading symbol (e.g., EURUSD)
+        symbols: Trading symbols (e.g., ["EURUSD", "USDJPY"])
         timeframe: Timeframe (M1, M5, M15, M30, H1, H4, D1, W1, MN1)
-        count: Number of bars to fetch
-        output_format: Output format (csv or json)
+        count: Number of bars to fetch per symbol
 
     Returns:
-        Formatted rates data
+        JSON object mapping each symbol to its column arrays
     """
-    config = Mt5Config(login=login, password=password, server=server)
-    client = Mt5TradingClient(config=config)
-
-    try:
-        client.initialize_and_login_mt5()
+    _check_timeframe(timeframe)
+    return execute_skill(
+        "fetch_rates_batch",
+        fetch_rates_batch_with_client,
+        login,
+        password,
+        server,
+        symbols=symbols,
+        timeframe=timeframe,
+        count=count,
+    )
 
-        rates_df = client.fetch_latest_rates_as_df(
-            symbol=symbol,
-            granularity=timeframe,
-            count=count,
-        )
 
-        if rates_df is None or rates_df.empty:
-            return f"No data found for {symbol}"
+def fetch_rates(
+    login: int,
+    password: str,
+    server: str,
+    symbol: str,
+    timeframe: str = "H1",
+    count: int = 100,
+    output_format: str = "csv",
+    output: TextIO | None = None,
+) -> str | None:
+    """Fetch OHLCV rates from MT5.
 
-        rates_df = rates_df.reset_index()
+    Uses the shared daemon session when MT5_AGENT_DAEMON points at a
+    running daemon; otherwise connects in-process.
 
-        if output_format == "json":
-            return rates_df.to_json(orient="records", date_format="iso", indent=2)
-        else:
-            return rates_df.to_csv(index=False)
+    Args:
+        login: MT5 account number
+        password: Account password
+        server: Broker server name
+        symbol: Trading symbol (e.g., EURUSD)
+        timeframe: Timeframe (M1, M5, M15, M30, H1, H4, D1, W1, MN1)
+        count: Number of bars to fetch
+        output_format: Output format (csv, json, or arrow)
+        output: Optional text sink for streaming (in-process path only)
 
-    finally:
-        try:
-            client.shutdown()
-        except Exception:
-            pass
+    Returns:
+        Formatted rates data, or None when streamed into output
+    """
+    _check_timeframe(timeframe)
+    return execute_skill(
+        "fetch_rates",
+        fetch_rates_with_client,
+        login,
+        password,
+        server,
+        local_kwargs={"output": output},
+        symbol=symbol,
+        timeframe=timeframe,
+        count=count,
+        output_format=output_format,
+    )
 
 
 def main():
@@ -66,11 +283,17 @@ def main():
     parser.add_argument("--login", type=int, required=True, help="MT5 account number")
     parser.add_argument("--password", required=True, help="Account password")
     parser.add_argument("--server", required=True, help="Broker server name")
-    parser.add_argument("--symbol", required=True, help="Trading symbol (e.g., EURUSD)")
+    parser.add_argument(
+        "--symbol",
+        nargs="+",
+        required=True,
+        help="Trading symbol(s) (e.g., EURUSD); several symbols share one "
+        "connection and are fetched concurrently",
+    )
     parser.add_argument(
         "--timeframe",
         default="H1",
-        choices=["M1", "M5", "M15", "M30", "H1", "H4", "D1", "W1", "MN1"],
+        choices=_TIMEFRAMES,
         help="Timeframe (default: H1)",
     )
     parser.add_argument(
@@ -78,29 +301,60 @@ def main():
     )
     parser.add_argument(
         "--format",
-        choices=["csv", "json"],
+        choices=["csv", "json", "arrow"],
         default="csv",
-        help="Output format (default: csv)",
+        help="Output format (default: csv); arrow emits a base64-encoded "
+        "Arrow IPC stream and requires pyarrow",
     )
     parser.add_argument("--output", "-o", help="Output file (default: stdout)")
 
     args = parser.parse_args()
 
-    result = fetch_rates(
-        login=args.login,
-        password=args.password,
-        server=args.server,
-        symbol=args.symbol,
-        timeframe=args.timeframe,
-        count=args.count,
-        output_format=args.format,
-    )
+    if len(args.symbol) > 1:
+        if args.format != "json":
+            parser.error("multiple symbols require --format json")
+        result = fetch_rates_batch(
+            login=args.login,
+            password=args.password,
+            server=args.server,
+            symbols=args.symbol,
+            timeframe=args.timeframe,
+            count=args.count,
+        )
+        if args.output:
+            with open(args.output, "w") as sink:
+                sink.write(result)
+        else:
+            print(result)
+        return
 
     if args.output:
-        with open(args.output, "w") as f:
-            f.write(result)
+        with open(args.output, "w") as sink:
+            result = fetch_rates(
+                login=args.login,
+                password=args.password,
+                server=args.server,
+                symbol=args.symbol[0],
+                timeframe=args.timeframe,
+                count=args.count,
+                output_format=args.format,
+                output=sink,
+            )
+            if result is not None:
+                sink.write(result)
     else:
-        print(result)
+        result = fetch_rates(
+            login=args.login,
+            password=args.password,
+            server=args.server,
+            symbol=args.symbol[0],
+            timeframe=args.timeframe,
+            count=args.count,
+            output_format=args.format,
+            output=sys.stdout,
+        )
+        if result is not None:
+            print(result)
 
 
 if __name__ == "__main__":
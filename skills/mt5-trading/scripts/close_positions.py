@@ -1,11 +1,91 @@
 #!/usr/bin/env python3
 """Close open positions on MT5."""
 
+from __future__ import annotations
+
 import argparse
-import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import orjson
+
+if TYPE_CHECKING:
+    from pdmt5 import Mt5TradingClient
+
+_CONNECTION_SCRIPTS = str(
+    Path(__file__).resolve().parents[2] / "mt5-connection" / "scripts"
+)
+if _CONNECTION_SCRIPTS not in sys.path:
+    sys.path.insert(0, _CONNECTION_SCRIPTS)
+
+from mt5_daemon import execute_skill
+from order_results import order_result_to_dict, pack_optional
+
+
+def close_positions_with_client(
+    client: Mt5TradingClient,
+    symbols: list[str] | None = None,
+    magic: int | None = None,
+    comment: str = "",
+) -> dict:
+    """Close open positions using an already-connected client.
+
+    Args:
+        client: Connected Mt5TradingClient instance
+        symbols: List of symbols to close (None = all)
+        magic: Only close positions with this magic number
+        comment: Comment for close orders
+
+    Returns:
+        Close results dictionary
+    """
+    # Get current positions first
+    positions_df = client.fetch_positions_with_metrics_as_df(symbols=symbols)
+
+    if positions_df is None or len(positions_df) == 0:
+        return {
+            "closed_count": 0,
+            "results": [],
+            "message": "No open positions found",
+        }
+
+    # Close positions, one worker per symbol; the MT5 binding releases
+    # the GIL during IPC, so closes on different symbols overlap.
+    target_symbols = sorted(symbols if symbols else positions_df["symbol"].unique())
+    close_kwargs = pack_optional(comment=comment, deviation=20, magic=magic)
+
+    if len(target_symbols) <= 1:
+        results = client.close_open_positions(symbols=target_symbols, **close_kwargs)
+    else:
+        results = []
+        with ThreadPoolExecutor(
+            max_workers=min(8, len(target_symbols))
+        ) as executor:
+            futures = [
+                executor.submit(
+                    client.close_open_positions, symbols=[s], **close_kwargs
+                )
+                for s in target_symbols
+            ]
+            for future in futures:
+                results.extend(future.result() or [])
+
+    if not results:
+        return {
+            "closed_count": 0,
+            "results": [],
+            "message": "No positions closed",
+        }
 
-from pdmt5 import Mt5Config, Mt5TradingClient
+    results_data = [order_result_to_dict(r) for r in results]
+
+    return {
+        "closed_count": len(results_data),
+        "results": results_data,
+        "message": f"Closed {len(results_data)} position(s)",
+    }
 
 
 def close_positions(
@@ -18,6 +98,9 @@ def close_positions(
 ) -> dict:
     """Close open positions on MT5.
 
+    Uses the shared daemon session when MT5_AGENT_DAEMON points at a
+    running daemon; otherwise connects in-process.
+
     Args:
         login: MT5 account number
         password: Account password
@@ -29,61 +112,16 @@ def close_positions(
     Returns:
         Close results dictionary
     """
-    config = Mt5Config(login=login, password=password, server=server)
-    client = Mt5TradingClient(config=config)
-
-    try:
-        client.initialize_and_login_mt5()
-
-        # Get current positions first
-        positions_df = client.fetch_positions_with_metrics_as_df(symbols=symbols)
-
-        if positions_df is None or positions_df.empty:
-            return {
-                "closed_count": 0,
-                "results": [],
-                "message": "No open positions found",
-            }
-
-        # Close positions
-        close_kwargs = {"comment": comment, "deviation": 20}
-        if symbols:
-            close_kwargs["symbols"] = symbols
-        if magic is not None:
-            close_kwargs["magic"] = magic
-
-        results = client.close_open_positions(**close_kwargs)
-
-        if not results:
-            return {
-                "closed_count": 0,
-                "results": [],
-                "message": "No positions closed",
-            }
-
-        results_data = []
-        for r in results:
-            results_data.append({
-                "retcode": r.retcode,
-                "deal": r.deal,
-                "order": r.order,
-                "volume": r.volume,
-                "price": r.price,
-                "comment": r.comment,
-                "success": r.retcode == 10009,
-            })
-
-        return {
-            "closed_count": len(results_data),
-            "results": results_data,
-            "message": f"Closed {len(results_data)} position(s)",
-        }
-
-    finally:
-        try:
-            client.shutdown()
-        except Exception:
-            pass
+    return execute_skill(
+        "close_positions",
+        close_positions_with_client,
+        login,
+        password,
+        server,
+        symbols=symbols,
+        magic=magic,
+        comment=comment,
+    )
 
 
 def main():
@@ -108,7 +146,10 @@ def main():
         comment=args.comment,
     )
 
-    print(json.dumps(result, indent=2))
+    sys.stdout.buffer.write(
+        orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        + b"\n"
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Shared order-result serialization for the trading scripts."""
+
+from __future__ import annotations
+
+import operator
+import sys
+
+# mt5.TRADE_RETCODE_DONE, kept as a literal so the MetaTrader5 import
+# stays deferred; see references/return_codes.md.
+_TRADE_RETCODE_DONE = 10009
+
+# Retcodes reported as success; extend here (e.g. with
+# TRADE_RETCODE_DONE_PARTIAL, 10010) if partial fills should count.
+_OK_RETCODES = frozenset({_TRADE_RETCODE_DONE})
+
+# Interned once so per-row dict insertion hits the pointer-equality
+# fast path instead of re-hashing the key strings.
+_RESULT_FIELDS = tuple(
+    map(sys.intern, ("retcode", "deal", "order", "volume", "price", "comment"))
+)
+_get_result_fields = operator.attrgetter(*_RESULT_FIELDS)
+
+
+def pack_optional(**kwargs) -> dict:
+    """Build a kwargs dict, dropping entries whose value is None.
+
+    Args:
+        **kwargs: Candidate keyword arguments
+
+    Returns:
+        Dict with the None-valued entries filtered out
+    """
+    return {key: value for key, value in kwargs.items() if value is not None}
+
+
+def order_result_to_dict(result, **extra) -> dict:
+    """Serialize an MT5 order result into the scripts' common row shape.
+
+    Args:
+        result: OrderSendResult-like object from the client
+        **extra: Additional fields appended to the row (e.g., bid, ask)
+
+    Returns:
+        Dict with the shared result fields, a success flag, and extras
+    """
+    row = dict(zip(_RESULT_FIELDS, _get_result_fields(result)))
+    row["success"] = result.retcode in _OK_RETCODES
+    row.update(extra)
+    return row
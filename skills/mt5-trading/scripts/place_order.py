@@ -1,11 +1,70 @@
 #!/usr/bin/env python3
 """Place market orders on MT5 with validation."""
 
+from __future__ import annotations
+
 import argparse
-import json
 import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import orjson
+
+if TYPE_CHECKING:
+    from pdmt5 import Mt5TradingClient
+
+_CONNECTION_SCRIPTS = str(
+    Path(__file__).resolve().parents[2] / "mt5-connection" / "scripts"
+)
+if _CONNECTION_SCRIPTS not in sys.path:
+    sys.path.insert(0, _CONNECTION_SCRIPTS)
+
+from mt5_daemon import execute_skill
+from order_results import order_result_to_dict
 
-from pdmt5 import Mt5Config, Mt5TradingClient
+
+def place_order_with_client(
+    client: Mt5TradingClient,
+    symbol: str,
+    volume: float,
+    side: str,
+    sl: float | None = None,
+    tp: float | None = None,
+    comment: str = "",
+    magic: int = 0,
+    dry_run: bool = True,
+) -> dict:
+    """Place a market order using an already-connected client.
+
+    Args:
+        client: Connected Mt5TradingClient instance
+        symbol: Trading symbol
+        volume: Lot size
+        side: Order side (BUY or SELL)
+        sl: Stop loss price
+        tp: Take profit price
+        comment: Order comment
+        magic: Magic number
+        dry_run: If True, validate only without executing
+
+    Returns:
+        Order result dictionary
+    """
+    result = client.place_market_order(
+        symbol=symbol,
+        volume=volume,
+        order_side=side,
+        sl=sl,
+        tp=tp,
+        deviation=20,
+        comment=comment,
+        magic=magic,
+        dry_run=dry_run,
+    )
+
+    return order_result_to_dict(
+        result, bid=result.bid, ask=result.ask, dry_run=dry_run
+    )
 
 
 def place_order(
@@ -23,6 +82,9 @@ def place_order(
 ) -> dict:
     """Place a market order on MT5.
 
+    Uses the shared daemon session when MT5_AGENT_DAEMON points at a
+    running daemon; otherwise connects in-process.
+
     Args:
         login: MT5 account number
         password: Account password
@@ -39,42 +101,23 @@ def place_order(
     Returns:
         Order result dictionary
     """
-    config = Mt5Config(login=login, password=password, server=server)
-    client = Mt5TradingClient(config=config)
-
-    try:
-        client.initialize_and_login_mt5()
-
-        result = client.place_market_order(
-            symbol=symbol,
-            volume=volume,
-            order_side=side.upper(),
-            sl=sl,
-            tp=tp,
-            deviation=20,
-            comment=comment,
-            magic=magic,
-            dry_run=dry_run,
-        )
-
-        return {
-            "retcode": result.retcode,
-            "deal": result.deal,
-            "order": result.order,
-            "volume": result.volume,
-            "price": result.price,
-            "bid": result.bid,
-            "ask": result.ask,
-            "comment": result.comment,
-            "dry_run": dry_run,
-            "success": result.retcode == 10009,
-        }
-
-    finally:
-        try:
-            client.shutdown()
-        except Exception:
-            pass
+    # Normalized once here; everything downstream trusts uppercase.
+    side = side.upper()
+    return execute_skill(
+        "place_order",
+        place_order_with_client,
+        login,
+        password,
+        server,
+        symbol=symbol,
+        volume=volume,
+        side=side,
+        sl=sl,
+        tp=tp,
+        comment=comment,
+        magic=magic,
+        dry_run=dry_run,
+    )
 
 
 def main():
@@ -85,7 +128,7 @@ def main():
     parser.add_argument("--symbol", required=True, help="Trading symbol")
     parser.add_argument("--volume", type=float, required=True, help="Lot size")
     parser.add_argument(
-        "--side", required=True, choices=["BUY", "SELL", "buy", "sell"], help="Order side"
+        "--side", required=True, type=str.upper, choices=["BUY", "SELL"], help="Order side"
     )
     parser.add_argument("--sl", type=float, help="Stop loss price")
     parser.add_argument("--tp", type=float, help="Take profit price")
@@ -113,7 +156,10 @@ def main():
         dry_run=not args.execute,
     )
 
-    print(json.dumps(result, indent=2))
+    sys.stdout.buffer.write(
+        orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        + b"\n"
+    )
 
     if not result["success"]:
         sys.exit(1)